@@ -3,9 +3,13 @@ from collections import defaultdict
 import statistics
 import heapq
 from log_reporter.models import LogEvent, LogLevel
+from log_reporter.sampling import count_interval, percentile_interval, proportion_interval
 
 class LogAnalyzer:
-    def __init__(self, top_n: int = 10):
+    def __init__(self, top_n: int = 10, sample_rate: float = 1.0):
+        # Fraction of input lines that reach process_event (see LineSampler).
+        # Counts are scaled by 1/sample_rate in the summary.
+        self.sample_rate = sample_rate
         self.total_requests = 0
         self.level_counts = Counter()
         self.service_counts = Counter()
@@ -88,24 +92,50 @@ class LogAnalyzer:
                 self.anomalies.append({
                     "time": time_key,
                     "error_rate": round(error_rate, 2),
-                    "total": total,
-                    "errors": counts["error"]
+                    "total": self._scale(total),
+                    "errors": self._scale(counts["error"])
                 })
         
         # Sort anomalies by time
         self.anomalies.sort(key=lambda x: x["time"])
 
+    def _scale(self, count: int) -> int:
+        # Scale a sampled count back up to the estimated population count
+        if self.sample_rate >= 1.0:
+            return count
+        return int(round(count / self.sample_rate))
+
+    def compute_confidence(self) -> Dict:
+        """95% confidence intervals for the sampled estimates."""
+        rate = self.sample_rate
+        errors = self.level_counts[LogLevel.ERROR] + self.level_counts[LogLevel.FATAL]
+        sorted_durs = sorted(self.durations)
+        return {
+            "sample_rate": rate,
+            "sampled_events": self.total_requests,
+            "total_requests": count_interval(self.total_requests, rate),
+            "errors": count_interval(errors, rate),
+            "error_rate": proportion_interval(errors, self.total_requests, rate),
+            "duration_stats": {
+                name: percentile_interval(sorted_durs, q, rate)
+                for name, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+            },
+        }
+
     def get_summary(self) -> Dict:
         percentiles = self.compute_percentiles()
         # Slowest requests: sort desc
         sorted_slowest = sorted(self.slowest_requests, key=lambda x: x[0], reverse=True)
+
+        def scale_counts(counts: Counter) -> Dict:
+            return {k: self._scale(v) for k, v in counts.items()}
         
-        return {
-            "total_requests": self.total_requests,
+        summary = {
+            "total_requests": self._scale(self.total_requests),
             "duration_stats": percentiles,
-            "level_counts": dict(self.level_counts),
-            "service_counts": dict(self.service_counts),
-            "status_codes": dict(self.status_codes),
+            "level_counts": scale_counts(self.level_counts),
+            "service_counts": scale_counts(self.service_counts),
+            "status_codes": scale_counts(self.status_codes),
             "slowest_requests": [
                 {"duration": d, "request_id": r, "msg": m} for d, r, m in sorted_slowest
             ],
@@ -113,3 +143,7 @@ class LogAnalyzer:
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "end_time": self.end_time.isoformat() if self.end_time else None
         }
+        # Only sampled runs carry error bars; exact runs keep the original shape
+        if self.sample_rate < 1.0:
+            summary["sampling"] = self.compute_confidence()
+        return summary
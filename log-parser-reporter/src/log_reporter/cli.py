@@ -11,6 +11,7 @@ from log_reporter.parsers.json_parser import JsonLogParser
 from log_reporter.parsers.text_parser import TextLogParser
 from log_reporter.analyzer import LogAnalyzer
 from log_reporter.reporter import Reporter
+from log_reporter.sampling import LineSampler, rate_for_budget
 
 app = typer.Typer(help="High-performance log parsing CLI")
 console = Console()
@@ -30,7 +31,10 @@ def get_files(input_path: Path) -> List[Path]:
 def process_logs(
     input: Path, 
     strict: bool,
-    analyzer: LogAnalyzer
+    analyzer: LogAnalyzer,
+    sample_rate: float = 1.0,
+    time_budget: Optional[float] = None,
+    seed: Optional[int] = None
 ) -> List[tuple]:
     failed_events = []
     files = get_files(input)
@@ -38,15 +42,26 @@ def process_logs(
     if not files:
         console.print(f"[red]No files found in {input}[/red]")
         raise typer.Exit(code=1)
+    if not 0.0 < sample_rate <= 1.0:
+        console.print(f"[red]--sample must be in (0, 1], got {sample_rate}[/red]")
+        raise typer.Exit(code=1)
 
     console.print(f"[green]Processing {len(files)} files...[/green]")
     
     parsers = [JsonLogParser(), TextLogParser()]
+
+    if time_budget is not None:
+        budget_rate = rate_for_budget(files, time_budget, parsers[0].parse_line)
+        sample_rate = min(sample_rate, budget_rate)
+    if sample_rate < 1.0:
+        console.print(f"[yellow]Sampling {sample_rate:.4%} of lines[/yellow]")
+    analyzer.sample_rate = sample_rate
+    sampler = LineSampler(sample_rate, seed=seed)
     
     for file in files:
         console.print(f"Reading {file.name}...")
         with open(file, "r", encoding="utf-8") as f:
-            for line_no, line in enumerate(f, 1):
+            for line_no, line in sampler.sample(f):
                 parsed = False
                 error = "No parser matched"
                 
@@ -72,13 +87,16 @@ def process_logs(
 def parse(
     input: Path = typer.Option(..., exists=True, help="Input file or directory"),
     strict: bool = typer.Option(False, help="Fail on first error"),
-    top: int = typer.Option(10, help="Number of slowest requests to show")
+    top: int = typer.Option(10, help="Number of slowest requests to show"),
+    sample: float = typer.Option(1.0, help="Fraction of lines to sample (0-1], e.g. 0.01"),
+    time_budget: Optional[float] = typer.Option(None, help="Target run time in seconds; picks a sample rate"),
+    seed: Optional[int] = typer.Option(None, help="Random seed for reproducible sampling")
 ):
     """Parse logs and print summary to console."""
     analyzer = LogAnalyzer(top_n=top)
     
     start = datetime.now()
-    failed = process_logs(input, strict, analyzer)
+    failed = process_logs(input, strict, analyzer, sample, time_budget, seed)
     duration = (datetime.now() - start).total_seconds()
     
     analyzer.detect_anomalies()
@@ -112,13 +130,33 @@ def parse(
         for a in summary["anomalies"]:
             console.print(f"  {a['time']}: {a['error_rate']*100:.1f}% Error Rate (Total: {a['total']})")
 
+    if "sampling" in summary:
+        print_sampling_table(summary["sampling"])
+
+def print_sampling_table(sampling: dict):
+    c_table = Table(title=f"Sampled Estimates (rate {sampling['sample_rate']:.4%}, 95% CI)")
+    c_table.add_column("Metric")
+    c_table.add_column("Estimate")
+    c_table.add_column("95% CI")
+    for name in ("total_requests", "errors"):
+        ci = sampling[name]
+        c_table.add_row(name, f"{ci['estimate']:.0f}", f"{ci['low']:.0f} - {ci['high']:.0f}")
+    ci = sampling["error_rate"]
+    c_table.add_row("error_rate", f"{ci['estimate']:.2%}", f"{ci['low']:.2%} - {ci['high']:.2%}")
+    for name, ci in sampling["duration_stats"].items():
+        c_table.add_row(f"{name} (ms)", f"{ci['estimate']:.2f}", f"{ci['low']:.2f} - {ci['high']:.2f}")
+    console.print(c_table)
+
 @app.command()
 def report(
     input: Path = typer.Option(..., exists=True, help="Input file or directory"),
     output: Path = typer.Option(Path("out"), help="Output directory"),
     strict: bool = typer.Option(False, help="Fail on first error"),
     top: int = typer.Option(10, help="Number of slowest requests to show"),
-    format: str = typer.Option("both", help="Output format: html, csv, or both")
+    format: str = typer.Option("both", help="Output format: html, csv, or both"),
+    sample: float = typer.Option(1.0, help="Fraction of lines to sample (0-1], e.g. 0.01"),
+    time_budget: Optional[float] = typer.Option(None, help="Target run time in seconds; picks a sample rate"),
+    seed: Optional[int] = typer.Option(None, help="Random seed for reproducible sampling")
 ):
     """Parse logs and generate report files."""
     run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -126,7 +164,7 @@ def report(
     reporter = Reporter(run_dir)
     
     analyzer = LogAnalyzer(top_n=top)
-    failed = process_logs(input, strict, analyzer)
+    failed = process_logs(input, strict, analyzer, sample, time_budget, seed)
     analyzer.detect_anomalies()
     summary = analyzer.get_summary()
 
@@ -0,0 +1,138 @@
+import math
+import random
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Two-sided 95% normal quantile, used for all confidence intervals below
+Z_95 = 1.96
+
+
+class LineSampler:
+    """Bernoulli line sampler, applied per file (proportional stratification).
+
+    Every line of every file is kept independently with probability `rate`,
+    so each file contributes in proportion to its size and the counts can be
+    scaled back up with 1/rate. Skipped lines are never parsed, which is where
+    almost all of the per-line cost goes.
+    """
+
+    def __init__(self, rate: float, seed: Optional[int] = None):
+        if not 0.0 < rate <= 1.0:
+            raise ValueError(f"Sample rate must be in (0, 1], got {rate}")
+        self.rate = rate
+        self.rng = random.Random(seed)
+        self.lines_seen = 0
+        self.lines_sampled = 0
+
+    def sample(self, lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+        """Yield (line_no, line) for the sampled subset of `lines`."""
+        if self.rate >= 1.0:
+            for line_no, line in enumerate(lines, 1):
+                self.lines_seen += 1
+                self.lines_sampled += 1
+                yield line_no, line
+            return
+
+        # Geometric skipping: draw the gap to the next sampled line instead of
+        # one random number per line. Same distribution as per-line coin flips.
+        log_q = math.log(1.0 - self.rate)
+        skip = self._next_gap(log_q)
+        for line_no, line in enumerate(lines, 1):
+            self.lines_seen += 1
+            if skip > 0:
+                skip -= 1
+                continue
+            self.lines_sampled += 1
+            yield line_no, line
+            skip = self._next_gap(log_q)
+
+    def _next_gap(self, log_q: float) -> int:
+        u = 1.0 - self.rng.random()  # (0, 1]
+        return int(math.log(u) / log_q)
+
+
+def rate_for_budget(
+    files: List[Path],
+    budget_s: float,
+    parse_line: Callable[[str], object],
+    pilot_s: float = 0.5,
+    pilot_lines: int = 20000,
+) -> float:
+    """Pick a sample rate so parsing `files` fits roughly into `budget_s`.
+
+    Runs a short pilot over the head of the first file to measure parse
+    throughput in bytes/sec, then scales it against the total input size.
+    Pilot results are thrown away so the real pass uses one uniform rate.
+    """
+    total_bytes = sum(f.stat().st_size for f in files)
+    if total_bytes == 0 or not files:
+        return 1.0
+
+    pilot_bytes = 0
+    start = time.perf_counter()
+    with open(files[0], "r", encoding="utf-8") as f:
+        for i, line in enumerate(f):
+            parse_line(line)
+            pilot_bytes += len(line)
+            if i >= pilot_lines or time.perf_counter() - start > pilot_s:
+                break
+    elapsed = max(time.perf_counter() - start, 1e-6)
+    bytes_per_s = pilot_bytes / elapsed
+
+    remaining = max(budget_s - elapsed, 0.0)
+    rate = (remaining * bytes_per_s) / total_bytes
+    # Never go below one line in 100k; below that the intervals are useless anyway
+    return min(1.0, max(rate, 1e-5))
+
+
+def count_interval(sampled: int, rate: float, z: float = Z_95) -> Dict[str, float]:
+    """Horvitz-Thompson estimate of a population count under Bernoulli sampling."""
+    estimate = sampled / rate
+    se = math.sqrt(sampled * (1.0 - rate)) / rate
+    return {
+        "estimate": round(estimate, 2),
+        "low": round(max(float(sampled), estimate - z * se), 2),
+        "high": round(estimate + z * se, 2),
+    }
+
+
+def proportion_interval(
+    hits: int, n: int, rate: float = 1.0, z: float = Z_95
+) -> Dict[str, float]:
+    """Normal-approximation interval for a ratio such as the error rate.
+
+    The (1 - rate) factor is the finite population correction: at rate 1.0
+    the whole input was read and the interval collapses to the point value.
+    """
+    if n == 0:
+        return {"estimate": 0.0, "low": 0.0, "high": 0.0}
+    p = hits / n
+    se = math.sqrt(p * (1.0 - p) / n * (1.0 - rate))
+    return {
+        "estimate": round(p, 4),
+        "low": round(max(0.0, p - z * se), 4),
+        "high": round(min(1.0, p + z * se), 4),
+    }
+
+
+def percentile_interval(
+    sorted_values: List[float], q: float, rate: float = 1.0, z: float = Z_95
+) -> Dict[str, float]:
+    """Distribution-free interval for a quantile from order statistics.
+
+    The rank of the true q-quantile in the sample is ~Binomial(n, q), so the
+    bounds are the order statistics at n*q -/+ z*sqrt(n*q*(1-q)).
+    """
+    n = len(sorted_values)
+    if n == 0:
+        return {"estimate": 0, "low": 0, "high": 0}
+    k = min(int(q * n), n - 1)
+    spread = z * math.sqrt(n * q * (1.0 - q) * (1.0 - rate))
+    lo = max(0, int(math.floor(q * n - spread)))
+    hi = min(n - 1, int(math.ceil(q * n + spread)))
+    return {
+        "estimate": sorted_values[k],
+        "low": sorted_values[min(lo, k)],
+        "high": sorted_values[max(hi, k)],
+    }
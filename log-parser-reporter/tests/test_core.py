@@ -62,3 +62,40 @@ class TestAnalyzer:
         assert len(slowest) == 2
         assert slowest[0]["duration"] == 100.0
         assert slowest[1]["duration"] == 50.0
+
+class TestSampling:
+    def test_line_sampler_rate(self):
+        from log_reporter.sampling import LineSampler
+        sampler = LineSampler(0.1, seed=42)
+        kept = list(sampler.sample(f"line {i}" for i in range(100000)))
+        assert sampler.lines_seen == 100000
+        assert 9000 < len(kept) < 11000
+        # Line numbers refer to the original input
+        assert all(line == f"line {no - 1}" for no, line in kept[:100])
+
+    def test_sampled_summary_has_intervals(self):
+        from log_reporter.sampling import LineSampler
+        rate = 0.2
+        analyzer = LogAnalyzer(sample_rate=rate)
+        events = [
+            LogEvent(
+                timestamp=datetime(2023, 1, 1, 12, 0),
+                level=LogLevel.ERROR if i % 10 == 0 else LogLevel.INFO,
+                message="test",
+                duration_ms=float(i % 100)
+            )
+            for i in range(20000)
+        ]
+        for _, event in LineSampler(rate, seed=7).sample(events):
+            analyzer.process_event(event)
+
+        summary = analyzer.get_summary()
+        sampling = summary["sampling"]
+        assert sampling["total_requests"]["low"] <= 20000 <= sampling["total_requests"]["high"]
+        assert sampling["error_rate"]["low"] <= 0.1 <= sampling["error_rate"]["high"]
+        assert sampling["duration_stats"]["p50"]["low"] <= 50 <= sampling["duration_stats"]["p50"]["high"]
+        assert abs(summary["total_requests"] - 20000) < 1000
+
+    def test_exact_summary_has_no_sampling_block(self):
+        analyzer = LogAnalyzer()
+        assert "sampling" not in analyzer.get_summary()